@@ -1,8 +1,5 @@
 from src.components.sensors.sensor import Sensor
-from src.components.sensors.sensor_connection_utils import (
-    udg_connection,
-    udg_connection_autotune,
-)
+from src.components.sensors.sensor_connection_utils import udg_connection_autotune
 from src.components.sensors.sensor_manager import SensorManager
 from src.engine.geo_color import Color
 from src.engine.geonet import GeoNetConfig, GeoNetEngine
@@ -31,7 +28,7 @@ def udg_setup(manager: SensorManager, _patches: PatchesGrid) -> None:
     sensors = manager.create_and_append_sensors(
         amount=50, initial_state=False, on_receive=on_receive
     )
-    manager.connect_sensors_if(sensors, udg_connection(10))
+    manager.connect_sensors_by_radius(sensors, radius=10)
     sensors[0].transmit(sensors[0], [1.0])
 
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import math
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     """
     A dataclass representing 2D coordinates with common mathematical operations.
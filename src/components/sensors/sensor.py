@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from copy import deepcopy
-from typing import TYPE_CHECKING, Generic, TypeVar, final, override
-import uuid
+from itertools import count
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar, final, override
 
 import pygame
 
@@ -34,7 +34,7 @@ class Sensor(Generic[T]):
         T: The type of the internal state maintained by the sensor
 
     Attributes:
-        _id (uuid.UUID): Unique identifier for the sensor
+        _id (int): Unique identifier for the sensor
         _cords (Coordinates): Position of the sensor on the grid
         _grid (PatchesGrid): Reference to the grid system
         _current_color (Color): Color used to display the sensor
@@ -44,10 +44,14 @@ class Sensor(Generic[T]):
         _pending_message_queue (list[float]): Buffer for incoming messages
         _state (T): Internal state of the sensor
         _current_patch_color (Color): Current color of the grid patch the sensor is on
-        _neighbour (set[Sensor]): Set of neighboring sensors
         _sensor_manager (SensorManager | None): Reference to the sensor manager
+
+    Class Variables:
+        _id_counter (count[int]): Source of the sensor IDs, shared by all sensors
     """
 
+    _id_counter: ClassVar[count[int]] = count()
+
     # =======================
     # Initialization
     # =======================
@@ -72,7 +76,7 @@ class Sensor(Generic[T]):
                 the environment changes. Function signature: (sensor, new_color) -> None
         """
         super().__init__()
-        self._id = uuid.uuid4()
+        self._id = next(Sensor._id_counter)
         self._cords = cords
         self._grid = patches
         self._current_color = Color.CYAN
@@ -85,20 +89,21 @@ class Sensor(Generic[T]):
         self._state: T = deepcopy(initial_state)
         self._current_patch_color = self._grid.get_color(self._cords)
 
-        # self._neighbour: set[Sensor[T]] = set()
-
         self._sensor_manager: SensorManager | None = None
 
     # =======================
     # Properties - sensor information access
     # =======================
     @property
-    def id(self) -> uuid.UUID:
+    def id(self) -> int:
         """
         Get the unique identifier of the sensor.
 
+        IDs are small integers handed out in creation order, which keeps them
+        cheap to hash in the sensor manager's lookup tables.
+
         Returns:
-            uuid.UUID: The sensor's unique identifier
+            int: The sensor's unique identifier
         """
         return self._id
 
@@ -124,6 +129,8 @@ class Sensor(Generic[T]):
             ValueError: If cords is not a Coordinates instance
         """
         self._cords = deepcopy(cords)
+        if self._sensor_manager is not None:
+            self._sensor_manager._on_sensor_moved(self)
 
     @property
     def neighbours(self) -> list[Sensor[T]]:
@@ -133,25 +140,10 @@ class Sensor(Generic[T]):
         Returns:
             list[Sensor[T]]: List of sensors connected to this sensor
         """
-        # if self._sensor_manager is None:
-        #     return []
-        # return [
-        #     data["sensor"]
-        #     for _, data in self._sensor_manager._nx_graph.nodes(data=True)
-        # ]
         if self._sensor_manager is None:
             return []
 
-        if self.id not in self._sensor_manager._nx_graph:
-            return []
-
-        graph = self._sensor_manager._nx_graph
-        connected_sensors: list[Sensor[T]] = []
-        for neighbor_id in graph.neighbors(self.id):
-            neighbor_sensor: Sensor[T] = graph.nodes[neighbor_id]["sensor"]
-            connected_sensors.append(neighbor_sensor)
-
-        return connected_sensors
+        return list(self._sensor_manager._adj[self._id])
 
     @property
     def state(self) -> T:
@@ -221,8 +213,14 @@ class Sensor(Generic[T]):
         Args:
             values (list[float]): List of numerical values to broadcast
         """
-        for neighbour in self.neighbours:
-            self.transmit(neighbour, values)
+        if len(values) == 0 or self._sensor_manager is None:
+            return
+
+        sensor_id = self._id
+        mark_transmission = self._sensor_manager._mark_transmission
+        for neighbour in self._sensor_manager._adj[sensor_id]:
+            mark_transmission(sensor_id, neighbour._id)
+            neighbour._pending_message_queue += values
 
     # =======================
     # Environmental sensing methods
@@ -243,7 +241,7 @@ class Sensor(Generic[T]):
         if self._on_measurement_change is not None:
             self._on_measurement_change(self, color)
 
-        self._current_patch_color = deepcopy(color)
+        self._current_patch_color = color
 
     def sensor_reading(self) -> Color:
         """
@@ -325,7 +323,7 @@ class Sensor(Generic[T]):
 
         This is an internal method called by the sensor manager during updates.
         """
-        msgs = deepcopy(self._message_queue)
+        msgs = self._message_queue
         if len(msgs) == 0:
             return
 
@@ -337,12 +335,15 @@ class Sensor(Generic[T]):
         """
         Flush the pending message queue to the active message queue.
 
+        The queues are swapped rather than copied; nothing else holds a
+        reference to the pending list.
+
         This is an internal method used by the simulation framework.
         """
-        self._message_queue = deepcopy(self._pending_message_queue)
+        self._message_queue = self._pending_message_queue
         self._pending_message_queue = []
 
-    def _draw(self, surface: pygame.Surface, offset: PatchesGrid) -> None:
+    def _draw(self, surface: pygame.Surface, pixel_pos: tuple[int, int]) -> None:
         """
         Draw the sensor on the pygame surface.
 
@@ -350,10 +351,10 @@ class Sensor(Generic[T]):
 
         Args:
             surface (pygame.Surface): The surface to draw on
-            offset (PatchesGrid): Grid system for coordinate conversion
+            pixel_pos (tuple[int, int]): Pixel position of the sensor, as
+                projected by the grid system
         """
         dot_radius = 5
-        dot_color = self._current_color
+        dot_color = self._current_color.to_pygame()
 
-        true_pos = offset.grid_to_pixel(int(self._cords.x), int(self._cords.y))
-        _ = pygame.draw.circle(surface, dot_color.to_tuple(), true_pos, dot_radius)
+        _ = pygame.draw.circle(surface, dot_color, pixel_pos, dot_radius)
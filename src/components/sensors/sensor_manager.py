@@ -3,17 +3,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
-from copy import deepcopy
-from itertools import combinations
+from collections.abc import Callable, Iterable, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar, final
-import uuid
 
 import networkx as nx
+import numpy as np
 import pygame
 
 from src.components.sensors.sensor_creation_utils import create_sensors
-from src.components.sensors.sensor_math import euclid_distance
+from src.components.sensors.sensor_math import (
+    euclid_distance,
+    pairwise_euclid_distances,
+)
 from src.engine.geo_color import Color
 from src.engine.grid import PatchesGrid
 
@@ -38,6 +39,21 @@ class SensorManager:
     Attributes:
         _nx_graph (nx.Graph): NetworkX graph representing the sensor network
         _grid (PatchesGrid): Reference to the grid system
+        _sensors_cache (list[Sensor]): All managed sensors in insertion order
+        _node_to_sensor (dict[int, Sensor]): Managed sensors by graph node ID
+        _adj (dict[int, list[Sensor]]): Neighbors of every managed sensor,
+            kept in step with the graph
+        _edges (dict[tuple[int, int], tuple[Sensor, Sensor, dict, int]]):
+            Every connection as (sensor1, sensor2, edge_data, edge_idx), keyed by
+            the sorted pair of sensor IDs. edge_data is the graph's attribute
+            dict and edge_idx the connection's row in the per-edge arrays.
+        _is_transmitting (np.ndarray): Transmission flag of every edge index
+        _edge_positions (np.ndarray): Pixel segment (x1, y1, x2, y2) of every
+            edge index
+        _edge_index_end (int): One past the highest edge index handed out so far
+        _free_edge_indices (list[int]): Released edge indices ready for reuse
+        _edge_trails (list[list[tuple[int, int]]] | None): Cached pixel polylines
+            covering every connection exactly once, None when outdated
     """
 
     # =======================
@@ -52,6 +68,18 @@ class SensorManager:
         """
         self._nx_graph = nx.Graph()
         self._grid: PatchesGrid = grid
+        self._sensors_cache: list[Sensor[Any]] = []
+        self._node_to_sensor: dict[int, Sensor[Any]] = {}
+        self._adj: dict[int, list[Sensor[Any]]] = {}
+        self._edges: dict[
+            tuple[int, int],
+            tuple[Sensor[Any], Sensor[Any], dict[str, Any], int],
+        ] = {}
+        self._edge_trails: list[list[tuple[int, int]]] | None = None
+        self._is_transmitting: np.ndarray = np.zeros(16, dtype=np.bool_)
+        self._edge_positions: np.ndarray = np.zeros((16, 4), dtype=np.intp)
+        self._edge_index_end = 0
+        self._free_edge_indices: list[int] = []
 
     # =======================
     # Information retrieval methods
@@ -63,20 +91,25 @@ class SensorManager:
         Returns:
             list[Sensor[T]]: List of all sensors in the network
         """
-        return [data["sensor"] for _, data in self._nx_graph.nodes(data=True)]
+        return list(self._sensors_cache)
 
     def list_edges(self) -> list[tuple[Sensor[T], Sensor[T], Any]]:
         """
         Get a list of all connections between sensors.
 
+        Besides the "weight", every edge_data holds "is_transmitting", which
+        tells whether data was sent over the connection in the current step.
+        Transmissions are tracked in an array, so the flag is only written into
+        edge_data when this method is called.
+
         Returns:
             list[tuple[Sensor[T], Sensor[T], Any]]: List of tuples containing
                 (sensor1, sensor2, edge_data) for each connection
         """
-        edges = []
-        for sensor1_id, sensor2_id, edge_data in self._nx_graph.edges(data=True):
-            sensor1 = self._nx_graph.nodes[sensor1_id]["sensor"]
-            sensor2 = self._nx_graph.nodes[sensor2_id]["sensor"]
+        is_transmitting: list[bool] = self._is_transmitting.tolist()
+        edges: list[tuple[Sensor[T], Sensor[T], Any]] = []
+        for sensor1, sensor2, edge_data, edge_idx in self._edges.values():
+            edge_data["is_transmitting"] = is_transmitting[edge_idx]
             edges.append((sensor1, sensor2, edge_data))
         return edges
 
@@ -90,15 +123,7 @@ class SensorManager:
         Returns:
             list[Sensor[T]]: List of sensors connected to the given sensor
         """
-        if sensor.id not in self._nx_graph:
-            return []
-
-        connected_sensors = []
-        for neighbor_id in self._nx_graph.neighbors(sensor.id):
-            neighbor_sensor = self._nx_graph.nodes[neighbor_id]["sensor"]
-            connected_sensors.append(neighbor_sensor)
-
-        return connected_sensors
+        return list(self._adj.get(sensor.id, ()))
 
     # =======================
     # Sensor management methods
@@ -145,9 +170,12 @@ class SensorManager:
         Args:
             sensor (Sensor[T]): The sensor to add to the network
         """
-        if sensor.id not in self._nx_graph:
+        if sensor.id not in self._node_to_sensor:
             sensor._sensor_manager = self
             self._nx_graph.add_node(sensor.id, sensor=sensor)
+            self._sensors_cache.append(sensor)
+            self._node_to_sensor[sensor.id] = sensor
+            self._adj[sensor.id] = []
 
     def append_multiple_sensors(self, sensors: list[Sensor[T]]) -> None:
         """
@@ -156,8 +184,18 @@ class SensorManager:
         Args:
             sensors (list[Sensor[T]]): Collection of sensors to add
         """
+        new_sensors: list[Sensor[T]] = []
         for sensor in sensors:
-            self.append_sensor(sensor)
+            if sensor.id not in self._node_to_sensor:
+                sensor._sensor_manager = self
+                self._sensors_cache.append(sensor)
+                self._node_to_sensor[sensor.id] = sensor
+                self._adj[sensor.id] = []
+                new_sensors.append(sensor)
+
+        self._nx_graph.add_nodes_from(
+            (sensor.id, {"sensor": sensor}) for sensor in new_sensors
+        )
 
     def remove_sensor(self, sensor: Sensor[T]) -> None:
         """
@@ -166,9 +204,18 @@ class SensorManager:
         Args:
             sensor (Sensor[T]): The sensor to remove from the network
         """
-        if sensor.id in self._nx_graph:
+        if sensor.id in self._node_to_sensor:
             sensor._sensor_manager = None
+            for neighbor in self._adj.pop(sensor.id):
+                edge_key = self._edge_key(sensor.id, neighbor.id)
+                *_, edge_idx = self._edges.pop(edge_key)
+                self._release_edge_index(edge_idx)
+                if neighbor is not sensor:
+                    self._adj[neighbor.id].remove(sensor)
+                self._edge_trails = None
             self._nx_graph.remove_node(sensor.id)
+            self._sensors_cache.remove(sensor)
+            del self._node_to_sensor[sensor.id]
 
     def remove_multiple_sensors(self, sensors: list[Sensor[T]]) -> None:
         """
@@ -198,19 +245,58 @@ class SensorManager:
             distance_metric (Callable, optional): Function to calculate distance
                 between sensors. Defaults to euclid_distance.
         """
-        if sensor1.id not in self._nx_graph:
-            self.append_sensor(sensor1)
+        if self._edge_key(sensor1.id, sensor2.id) in self._edges:
+            return
 
-        if sensor2.id not in self._nx_graph:
-            self.append_sensor(sensor2)
+        self._connect_sensors_weighted(
+            sensor1, sensor2, distance_metric(sensor1, sensor2)
+        )
+
+    def bulk_connect(
+        self, connections: Iterable[tuple[Sensor[T], Sensor[T], float]]
+    ) -> None:
+        """
+        Create many connections with already known weights at once.
+
+        Missing sensors are added to the network and all new connections are
+        inserted into the graph in one batch. Pairs that are already connected,
+        or that appear more than once, are only connected the first time.
+
+        Args:
+            connections (Iterable[tuple[Sensor[T], Sensor[T], float]]): The
+                (sensor1, sensor2, weight) triple of every connection to create
+        """
+        pending: dict[tuple[int, int], tuple[Sensor[T], Sensor[T], float]] = {}
+        for sensor1, sensor2, weight in connections:
+            edge_key = self._edge_key(sensor1.id, sensor2.id)
+            if edge_key not in self._edges and edge_key not in pending:
+                pending[edge_key] = (sensor1, sensor2, weight)
+        if len(pending) == 0:
+            return
+
+        self.append_multiple_sensors(
+            [
+                sensor
+                for sensor1, sensor2, _ in pending.values()
+                for sensor in (sensor1, sensor2)
+            ]
+        )
+        self._nx_graph.add_edges_from(
+            (sensor1.id, sensor2.id, {"weight": weight})
+            for sensor1, sensor2, weight in pending.values()
+        )
 
-        if not self._nx_graph.has_edge(sensor1.id, sensor2.id):
-            dist = distance_metric(sensor1, sensor2)
-            self._nx_graph.add_edge(
-                sensor1.id,
-                sensor2.id,
-                weight=dist,
-                is_transmitting=False,
+        pixel_positions: dict[int, tuple[int, int]] = {}
+        for edge_key, (sensor1, sensor2, _) in pending.items():
+            for sensor in (sensor1, sensor2):
+                if sensor.id not in pixel_positions:
+                    pixel_positions[sensor.id] = self._pixel_position(sensor)
+            self._register_edge(
+                edge_key,
+                sensor1,
+                sensor2,
+                pixel_positions[sensor1.id],
+                pixel_positions[sensor2.id],
             )
 
     def disconnect_sensors(self, sensor1: Sensor[T], sensor2: Sensor[T]) -> None:
@@ -221,13 +307,19 @@ class SensorManager:
             sensor1 (Sensor[T]): First sensor to disconnect
             sensor2 (Sensor[T]): Second sensor to disconnect
         """
-        if sensor1.id not in self._nx_graph:
+        if sensor1.id not in self._node_to_sensor:
             self.append_sensor(sensor1)
 
-        if sensor2.id not in self._nx_graph:
+        if sensor2.id not in self._node_to_sensor:
             self.append_sensor(sensor2)
 
         self._nx_graph.remove_edge(sensor1.id, sensor2.id)
+        *_, edge_idx = self._edges.pop(self._edge_key(sensor1.id, sensor2.id))
+        self._release_edge_index(edge_idx)
+        self._edge_trails = None
+        self._adj[sensor1.id].remove(sensor2)
+        if sensor1 is not sensor2:
+            self._adj[sensor2.id].remove(sensor1)
 
     def disconnect_multiple_sensors(self, sensors: Sequence[Sensor[T]]) -> None:
         """
@@ -236,8 +328,9 @@ class SensorManager:
         Args:
             sensors (Sequence[Sensor[T]]): Collection of sensors to disconnect from each other
         """
-        for sensor1, sensor2 in combinations(sensors, 2):
-            self.disconnect_sensors(sensor1, sensor2)
+        first, second = self._pair_indices(len(sensors))
+        for i, j in zip(first.tolist(), second.tolist(), strict=True):
+            self.disconnect_sensors(sensors[i], sensors[j])
 
     # =======================
     # Network topology creation methods
@@ -252,14 +345,31 @@ class SensorManager:
 
         Creates a complete graph where every sensor is connected to every other
         sensor. This provides maximum connectivity but high network overhead.
+        With the default metric all pairwise distances are computed in one
+        batched operation. All connections are inserted through bulk_connect.
 
         Args:
             sensors (Sequence[Sensor[T]]): Collection of sensors to connect
             distance_metric (Callable, optional): Function to calculate distance
                 between sensors. Defaults to euclid_distance.
         """
-        for sensor1, sensor2 in combinations(sensors, 2):
-            self.connect_sensors(sensor1, sensor2, distance_metric)
+        first, second = self._pair_indices(len(sensors))
+        if distance_metric is not euclid_distance:
+            self.bulk_connect(
+                (sensors[i], sensors[j], distance_metric(sensors[i], sensors[j]))
+                for i, j in zip(first.tolist(), second.tolist(), strict=True)
+            )
+            return
+
+        distances = pairwise_euclid_distances(
+            self._positions_array(sensors), (first, second)
+        )
+        self.bulk_connect(
+            (sensors[i], sensors[j], dist)
+            for i, j, dist in zip(
+                first.tolist(), second.tolist(), distances.tolist(), strict=True
+            )
+        )
 
     def connect_sensors_chain(
         self,
@@ -322,7 +432,8 @@ class SensorManager:
         Connect sensors based on a custom condition function.
 
         This method allows for flexible connection patterns by evaluating a
-        condition function for each pair of sensors.
+        condition function for each pair of sensors. With the default metric the
+        distances of all pairs are computed in one batched operation.
 
         Args:
             sensors (Sequence[Sensor[T]]): Collection of sensors to evaluate
@@ -331,14 +442,287 @@ class SensorManager:
             distance_metric (Callable, optional): Function to calculate distance
                 between sensors. Defaults to euclid_distance.
         """
-        for sensor1, sensor2 in combinations(sensors, 2):
-            if condition(sensor1, sensor2):
-                self.connect_sensors(sensor1, sensor2, distance_metric)
+        first, second = self._pair_indices(len(sensors))
+        if distance_metric is not euclid_distance:
+            self.bulk_connect(
+                (sensors[i], sensors[j], distance_metric(sensors[i], sensors[j]))
+                for i, j in zip(first.tolist(), second.tolist(), strict=True)
+                if condition(sensors[i], sensors[j])
+            )
+            return
+
+        distances = pairwise_euclid_distances(
+            self._positions_array(sensors), (first, second)
+        )
+        self.bulk_connect(
+            (sensors[i], sensors[j], dist)
+            for i, j, dist in zip(
+                first.tolist(), second.tolist(), distances.tolist(), strict=True
+            )
+            if condition(sensors[i], sensors[j])
+        )
+
+    def connect_sensors_by_radius(
+        self, sensors: Sequence[Sensor[T]], radius: float
+    ) -> None:
+        """
+        Connect all sensors that are within a given distance of each other.
+
+        This is the Unit Disk Graph topology. It gives the same result as
+        connect_sensors_if with udg_connection, but the distances of all pairs
+        are computed and filtered in one batched operation, so only the pairs
+        that pass are handled in Python.
+
+        Args:
+            sensors (Sequence[Sensor[T]]): Collection of sensors to evaluate
+            radius (float): Maximum euclidean distance between connected sensors
+        """
+        first, second = self._pair_indices(len(sensors))
+        distances = pairwise_euclid_distances(
+            self._positions_array(sensors), (first, second)
+        )
+        in_range = np.flatnonzero(distances <= radius)
+        self.bulk_connect(
+            (sensors[i], sensors[j], dist)
+            for i, j, dist in zip(
+                first[in_range].tolist(),
+                second[in_range].tolist(),
+                distances[in_range].tolist(),
+                strict=True,
+            )
+        )
 
     # =======================
     # Internal methods - DO NOT USE directly
     # =======================
-    def _mark_transmission(self, sender_id: uuid.UUID, receiver_id: uuid.UUID) -> None:
+    @staticmethod
+    def _edge_key(sensor1_id: int, sensor2_id: int) -> tuple[int, int]:
+        """
+        Build the direction-independent key of a connection.
+
+        Args:
+            sensor1_id (int): ID of one sensor of the connection
+            sensor2_id (int): ID of the other sensor of the connection
+
+        Returns:
+            tuple[int, int]: The two IDs in sorted order
+        """
+        if sensor1_id < sensor2_id:
+            return sensor1_id, sensor2_id
+        return sensor2_id, sensor1_id
+
+    @staticmethod
+    def _pair_indices(count: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Enumerate the index pairs (i, j) with i < j of a group of sensors.
+
+        The pairs are in the same order as the condensed distance vector of
+        pairwise_euclid_distances, so both can be zipped together, and can be
+        passed to it to avoid building them twice.
+
+        Args:
+            count (int): Number of sensors in the group
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The first and second index of every pair
+        """
+        return np.triu_indices(count, k=1)
+
+    def _positions_array(self, sensors: Sequence[Sensor[T]]) -> np.ndarray:
+        """
+        Collect the positions of the given sensors into a contiguous array.
+
+        Args:
+            sensors (Sequence[Sensor[T]]): The sensors to collect positions from
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) with one (x, y) row per sensor
+        """
+        positions = np.empty((len(sensors), 2), dtype=np.float64)
+        for i, sensor in enumerate(sensors):
+            positions[i] = sensor.position.x, sensor.position.y
+        return positions
+
+    def _connect_sensors_weighted(
+        self, sensor1: Sensor[T], sensor2: Sensor[T], weight: float
+    ) -> None:
+        """
+        Create a connection between two sensors with an already known weight.
+
+        This internal method is used by connect_sensors once the distance is
+        known.
+
+        Args:
+            sensor1 (Sensor[T]): First sensor to connect
+            sensor2 (Sensor[T]): Second sensor to connect
+            weight (float): Distance between the two sensors
+        """
+        if sensor1.id not in self._node_to_sensor:
+            self.append_sensor(sensor1)
+
+        if sensor2.id not in self._node_to_sensor:
+            self.append_sensor(sensor2)
+
+        edge_key = self._edge_key(sensor1.id, sensor2.id)
+        if edge_key in self._edges:
+            return
+
+        self._nx_graph.add_edge(sensor1.id, sensor2.id, weight=weight)
+        self._register_edge(
+            edge_key,
+            sensor1,
+            sensor2,
+            self._pixel_position(sensor1),
+            self._pixel_position(sensor2),
+        )
+
+    def _register_edge(
+        self,
+        edge_key: tuple[int, int],
+        sensor1: Sensor[T],
+        sensor2: Sensor[T],
+        pixel_pos1: tuple[int, int],
+        pixel_pos2: tuple[int, int],
+    ) -> None:
+        """
+        Record a connection that was just added to the graph in the side tables.
+
+        Args:
+            edge_key (tuple[int, int]): Key of the connection
+            sensor1 (Sensor[T]): First sensor of the connection
+            sensor2 (Sensor[T]): Second sensor of the connection
+            pixel_pos1 (tuple[int, int]): Pixel position of the first sensor
+            pixel_pos2 (tuple[int, int]): Pixel position of the second sensor
+        """
+        edge_data = self._nx_graph.edges[sensor1.id, sensor2.id]
+        edge_idx = self._allocate_edge_index()
+        self._edge_positions[edge_idx] = (*pixel_pos1, *pixel_pos2)
+        self._edges[edge_key] = (sensor1, sensor2, edge_data, edge_idx)
+        self._edge_trails = None
+        self._adj[sensor1.id].append(sensor2)
+        if sensor1 is not sensor2:
+            self._adj[sensor2.id].append(sensor1)
+
+    def _allocate_edge_index(self) -> int:
+        """
+        Reserve a slot in the per-edge arrays for a new connection.
+
+        Released indices are reused first, so the arrays stay as large as the
+        highest number of simultaneous connections.
+
+        Returns:
+            int: The edge index of the connection
+        """
+        if len(self._free_edge_indices) > 0:
+            return self._free_edge_indices.pop()
+
+        edge_idx = self._edge_index_end
+        self._edge_index_end += 1
+        capacity = len(self._is_transmitting)
+        if edge_idx >= capacity:
+            grown_flags = np.zeros(2 * capacity, dtype=np.bool_)
+            grown_flags[:capacity] = self._is_transmitting
+            self._is_transmitting = grown_flags
+            grown_positions = np.zeros((2 * capacity, 4), dtype=np.intp)
+            grown_positions[:capacity] = self._edge_positions
+            self._edge_positions = grown_positions
+        return edge_idx
+
+    def _release_edge_index(self, edge_idx: int) -> None:
+        """
+        Free the slot of a removed connection for reuse.
+
+        Args:
+            edge_idx (int): The edge index of the removed connection
+        """
+        self._is_transmitting[edge_idx] = False
+        self._free_edge_indices.append(edge_idx)
+
+    def _pixel_position(self, sensor: Sensor[T]) -> tuple[int, int]:
+        """
+        Project a sensor's grid position to the pixel at the center of its cell.
+
+        Args:
+            sensor (Sensor[T]): The sensor to project
+
+        Returns:
+            tuple[int, int]: Pixel coordinates of the sensor
+        """
+        return self._grid.grid_to_pixel(int(sensor.position.x), int(sensor.position.y))
+
+    def _on_sensor_moved(self, sensor: Sensor[T]) -> None:
+        """
+        Refresh the cached pixel positions of all connections of a moved sensor.
+
+        This internal method is called by Sensor when its position changes.
+
+        Args:
+            sensor (Sensor[T]): The sensor that changed position
+        """
+        pixel_pos = self._pixel_position(sensor)
+        for neighbor in self._adj.get(sensor.id, []):
+            edge_key = self._edge_key(sensor.id, neighbor.id)
+            sensor1, sensor2, _, edge_idx = self._edges[edge_key]
+            if sensor1 is sensor:
+                self._edge_positions[edge_idx, :2] = pixel_pos
+            if sensor2 is sensor:
+                self._edge_positions[edge_idx, 2:] = pixel_pos
+            self._edge_trails = None
+
+    def _build_edge_trails(self) -> list[list[tuple[int, int]]]:
+        """
+        Split all connections into polylines that can be drawn in one call each.
+
+        Every connection is walked exactly once. Walks start at sensors with an
+        odd number of connections first, which keeps the number of polylines
+        close to the minimum.
+
+        Returns:
+            list[list[tuple[int, int]]]: Pixel points of every polyline
+        """
+        unused = dict(self._edges)
+        positions: list[list[int]] = self._edge_positions.tolist()
+        incident: dict[int, list[tuple[int, int]]] = {}
+        for edge_key, (sensor1, sensor2, _, _) in unused.items():
+            incident.setdefault(sensor1.id, []).append(edge_key)
+            incident.setdefault(sensor2.id, []).append(edge_key)
+
+        odd_first = sorted(
+            incident, key=lambda sensor_id: len(incident[sensor_id]) % 2 == 0
+        )
+
+        trails: list[list[tuple[int, int]]] = []
+        for start_id in odd_first:
+            while True:
+                current_id = start_id
+                trail: list[tuple[int, int]] = []
+                while True:
+                    pending = incident[current_id]
+                    while len(pending) > 0 and pending[-1] not in unused:
+                        _ = pending.pop()
+                    if len(pending) == 0:
+                        break
+
+                    sensor1, sensor2, _, edge_idx = unused.pop(pending.pop())
+                    x1, y1, x2, y2 = positions[edge_idx]
+                    if sensor1.id == current_id:
+                        near, far = (x1, y1), (x2, y2)
+                        current_id = sensor2.id
+                    else:
+                        near, far = (x2, y2), (x1, y1)
+                        current_id = sensor1.id
+
+                    if len(trail) == 0:
+                        trail.append(near)
+                    trail.append(far)
+
+                if len(trail) == 0:
+                    break
+                trails.append(trail)
+
+        return trails
+
+    def _mark_transmission(self, sender_id: int, receiver_id: int) -> None:
         """
         Mark that data transmission is occurring on a connection.
 
@@ -346,11 +730,12 @@ class SensorManager:
         active communication links.
 
         Args:
-            sender_id (uuid.UUID): ID of the sending sensor
-            receiver_id (uuid.UUID): ID of the receiving sensor
+            sender_id (int): ID of the sending sensor
+            receiver_id (int): ID of the receiving sensor
         """
-        if self._nx_graph.has_edge(sender_id, receiver_id):
-            self._nx_graph.edges[sender_id, receiver_id]["is_transmitting"] = True
+        edge = self._edges.get(self._edge_key(sender_id, receiver_id))
+        if edge is not None:
+            self._is_transmitting[edge[3]] = True
 
     def _reset_transmissions(self) -> None:
         """
@@ -358,45 +743,44 @@ class SensorManager:
 
         This internal method clears transmission markers for visualization.
         """
-        for sensor1_id, sensor2_id in self._nx_graph.edges():
-            self._nx_graph.edges[sensor1_id, sensor2_id]["is_transmitting"] = False
+        self._is_transmitting.fill(False)
 
     def _draw(self, screen: pygame.Surface) -> None:
         """
         Draw the sensor network on the pygame surface.
 
         This internal method renders all sensors and their connections, with
-        special highlighting for active transmissions.
+        special highlighting for active transmissions. All connections are
+        drawn as cached polylines first; active ones are selected from the
+        edge segment array with the transmission mask and drawn over them.
 
         Args:
             screen (pygame.Surface): The surface to draw on
         """
-        for edge in self._nx_graph.edges():
-            sensor1_id, sensor2_id = edge
-            sensor1 = self._nx_graph.nodes[sensor1_id]["sensor"]
-            sensor2 = self._nx_graph.nodes[sensor2_id]["sensor"]
-            edge_data = self._nx_graph.edges[sensor1_id, sensor2_id]
-
-            pos1 = sensor1.position
-            pos2 = sensor2.position
+        if self._edge_trails is None:
+            self._edge_trails = self._build_edge_trails()
 
-            pixel_pos1 = self._grid.grid_to_pixel(int(pos1.x), int(pos1.y))
-            pixel_pos2 = self._grid.grid_to_pixel(int(pos2.x), int(pos2.y))
+        idle_color = Color.CONNECTION_GRAY.to_pygame()
+        for trail in self._edge_trails:
+            _ = pygame.draw.lines(screen, idle_color, False, trail, 2)
 
-            is_transmitting = edge_data.get("is_transmitting", False)
-            if is_transmitting:
-                color = Color.WHITE
-                line_width = 4
-            else:
-                color = Color.CONNECTION_GRAY
-                line_width = 2
+        transmitting_color = Color.WHITE.to_pygame()
+        transmitting_rows = self._edge_positions[self._is_transmitting]
+        for x1, y1, x2, y2 in transmitting_rows.tolist():
+            _ = pygame.draw.line(screen, transmitting_color, (x1, y1), (x2, y2), 4)
 
-            _ = pygame.draw.line(
-                screen, color.to_tuple(), pixel_pos1, pixel_pos2, line_width
-            )
+        sensors = self._sensors_cache
+        if len(sensors) == 0:
+            return
 
-        for sensor in self.list_sensors():
-            sensor._draw(screen, self._grid)
+        pixels_x, pixels_y = self._grid.grid_to_pixel_array(
+            [sensor.position.x for sensor in sensors],
+            [sensor.position.y for sensor in sensors],
+        )
+        for sensor, pixel_x, pixel_y in zip(
+            sensors, pixels_x.tolist(), pixels_y.tolist(), strict=True
+        ):
+            sensor._draw(screen, (pixel_x, pixel_y))
 
     def _flush(self):
         """
@@ -404,13 +788,14 @@ class SensorManager:
 
         This internal method processes pending messages for all sensors.
         """
-        for sensor in self.list_sensors():
+        for sensor in self._sensors_cache:
             sensor._flush_run()
 
     def _update(
         self,
         update_fn: Callable[[Any], Any],
         global_state: Any,
+        clone_fn: Callable[[Any], Any] | None = None,
     ):
         """
         Update the sensor network simulation state.
@@ -422,6 +807,9 @@ class SensorManager:
         Args:
             update_fn (Callable[[Any], Any]): User-defined update function
             global_state (Any): Current global state of the simulation
+            clone_fn (Callable[[Any], Any] | None, optional): Function used to copy
+                the state returned by update_fn. If None, the returned state is
+                passed on as is, so update_fn must return a fresh object.
 
         Returns:
             Any: Updated global state
@@ -429,10 +817,12 @@ class SensorManager:
         self._flush()
         self._reset_transmissions()
 
-        for sensor in self.list_sensors():
-            cell_color = self._grid.get_color(sensor.position)
-            sensor.measurement_update(cell_color)
+        get_color = self._grid.get_color
+        for sensor in self._sensors_cache:
+            sensor.measurement_update(get_color(sensor._cords))
             sensor._receive()
 
         new_global_state = update_fn(global_state)
-        return deepcopy(new_global_state)
+        if clone_fn is None:
+            return new_global_state
+        return clone_fn(new_global_state)
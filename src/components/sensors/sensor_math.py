@@ -7,6 +7,8 @@ simulations, including distance calculations and geometric operations.
 
 from typing import TypeVar
 
+import numpy as np
+
 from src.components.sensors.sensor import Sensor
 
 
@@ -31,3 +33,31 @@ def euclid_distance(sensor1: Sensor[T], sensor2: Sensor[T]) -> float:
     pos1 = sensor1.position
     pos2 = sensor2.position
     return pos1.euclid_distance(pos2)
+
+
+def pairwise_euclid_distances(
+    positions: np.ndarray, pair_indices: tuple[np.ndarray, np.ndarray] | None = None
+) -> np.ndarray:
+    """
+    Calculate the Euclidean distances between all pairs of positions at once.
+
+    This is the batched counterpart of euclid_distance. Only the upper triangle
+    of the distance matrix is computed, returned in condensed form: the entries
+    follow the order of ``itertools.combinations(range(N), 2)``.
+
+    Args:
+        positions (np.ndarray): Array of shape (N, 2) holding one (x, y) row per
+            sensor
+        pair_indices (tuple[np.ndarray, np.ndarray] | None, optional): The
+            result of ``np.triu_indices(N, k=1)`` if the caller already has it.
+            Defaults to None, which computes it.
+
+    Returns:
+        np.ndarray: Array of shape (N * (N - 1) / 2,) with the distance of every
+            pair (i, j) where i < j
+    """
+    if pair_indices is None:
+        pair_indices = np.triu_indices(len(positions), k=1)
+    first, second = pair_indices
+    deltas = positions[first] - positions[second]
+    return np.sqrt((deltas**2).sum(axis=1))
@@ -2,23 +2,40 @@
 Color definitions and utilities for the GeoNet simulation.
 
 This module provides the Color class and predefined color constants used throughout
-the GeoNet application for rendering and visual representation.
+the GeoNet application for rendering and visual representation. The constants are
+collected in the COLORS dict and exposed as Color class attributes.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import ClassVar
+from typing import ClassVar, NamedTuple
 
+import pygame
 
-@dataclass
-class Color:
+
+# pygame.Color objects created by Color.to_pygame, shared between calls
+_PYGAME_COLORS: dict[tuple[int, int, int], pygame.Color] = {}
+
+
+class _RGB(NamedTuple):
+    """
+    The raw (r, g, b) fields backing Color.
+    """
+
+    r: int
+    g: int
+    b: int
+
+
+class Color(_RGB):
     """
-    A dataclass representing RGB color values with predefined color constants.
+    An immutable RGB color with predefined color constants.
 
     This class provides color representation for the GeoNet application with
     validation and conversion utilities. It includes common color constants
-    used throughout the application.
+    used throughout the application. Colors are plain tuples, so they can be
+    handed to pygame without any conversion. Instances have no __dict__, are
+    hashable and compare equal to the matching (r, g, b) tuple.
 
     Attributes:
         r (int): Red component (0-255)
@@ -29,9 +46,7 @@ class Color:
         Various predefined color constants like BLACK, WHITE, RED, etc.
     """
 
-    r: int
-    g: int
-    b: int
+    __slots__ = ()
 
     BLACK: ClassVar[Color]
     WHITE: ClassVar[Color]
@@ -51,23 +66,21 @@ class Color:
     NAVY: ClassVar[Color]
     FOREST: ClassVar[Color]
 
-    def __post_init__(self) -> None:
+    def __new__(cls, r: int, g: int, b: int) -> Color:
         """
-        Validate RGB values after initialization.
+        Create a color, validating the RGB values in debug builds.
 
-        Ensures all RGB values are within the valid range of 0-255.
+        The check is skipped when Python runs with -O.
 
         Raises:
             ValueError: If any RGB value is outside the range 0-255
         """
-        if self.r > 255 or self.g > 255 or self.b > 255:
-            raise ValueError(
-                f"r, g, b must be below 255: r:{self.r}, g:{self.g}, b:{self.b}"
-            )
-        if self.r < 0 or self.g < 0 or self.b < 0:
-            raise ValueError(
-                f"r, g, b must be above 0: r:{self.r}, g:{self.g}, b:{self.b}"
-            )
+        if __debug__:
+            if r > 255 or g > 255 or b > 255:
+                raise ValueError(f"r, g, b must be below 255: r:{r}, g:{g}, b:{b}")
+            if r < 0 or g < 0 or b < 0:
+                raise ValueError(f"r, g, b must be above 0: r:{r}, g:{g}, b:{b}")
+        return super().__new__(cls, r, g, b)
 
     def to_tuple(self) -> tuple[int, int, int]:
         """
@@ -76,26 +89,77 @@ class Color:
         Returns:
             tuple[int, int, int]: A tuple containing (r, g, b) values
         """
-        return (self.r, self.g, self.b)
-
-
-# Color constant definitions
-Color.BLACK = Color(20, 20, 30)
-Color.WHITE = Color(255, 255, 255)
-Color.GRAY = Color(128, 128, 128)
-Color.CONNECTION_GRAY = Color(90, 90, 90)
-Color.LIGHT_GRAY = Color(64, 64, 64)
-
-Color.GREEN = Color(0, 255, 0)
-Color.RED = Color(255, 100, 100)
-Color.BLUE = Color(100, 100, 255)
-Color.CYAN = Color(0, 255, 255)
-
-Color.CREAM = Color(245, 245, 220)
-Color.SAGE = Color(188, 184, 138)
-Color.LAVENDER = Color(230, 230, 250)
-Color.SAND = Color(194, 178, 128)
-Color.MINT = Color(152, 255, 152)
-Color.DUSTY_ROSE = Color(220, 180, 180)
-Color.NAVY = Color(0, 0, 128)
-Color.FOREST = Color(34, 139, 34)
+        return self
+
+    def to_pygame(self) -> pygame.Color:
+        """
+        Convert the color to pygame's native color type.
+
+        The pygame.Color is created on first use and cached, so drawing calls
+        receive a ready-made color instead of converting a tuple every time.
+        The returned object is shared and must not be modified.
+
+        Returns:
+            pygame.Color: The cached pygame color
+        """
+        pygame_color = _PYGAME_COLORS.get(self)
+        if pygame_color is None:
+            pygame_color = pygame.Color(self.r, self.g, self.b)
+            _PYGAME_COLORS[self] = pygame_color
+        return pygame_color
+
+
+def _make_color(r: int, g: int, b: int) -> Color:
+    """
+    Build a palette color, validating it regardless of the -O flag.
+
+    The palette is checked once here at import time, so the constants skip the
+    validating Color constructor.
+
+    Args:
+        r (int): Red component (0-255)
+        g (int): Green component (0-255)
+        b (int): Blue component (0-255)
+
+    Returns:
+        Color: The palette color
+
+    Raises:
+        ValueError: If any RGB value is outside the range 0-255
+    """
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        raise ValueError(f"r, g, b must be within 0-255: r:{r}, g:{g}, b:{b}")
+    return tuple.__new__(Color, (r, g, b))
+
+
+# Color constant definitions, also available as Color.<NAME>
+COLORS: dict[str, Color] = {
+    "BLACK": _make_color(20, 20, 30),
+    "WHITE": _make_color(255, 255, 255),
+    "GRAY": _make_color(128, 128, 128),
+    "CONNECTION_GRAY": _make_color(90, 90, 90),
+    "LIGHT_GRAY": _make_color(64, 64, 64),
+    "GREEN": _make_color(0, 255, 0),
+    "RED": _make_color(255, 100, 100),
+    "BLUE": _make_color(100, 100, 255),
+    "CYAN": _make_color(0, 255, 255),
+    "CREAM": _make_color(245, 245, 220),
+    "SAGE": _make_color(188, 184, 138),
+    "LAVENDER": _make_color(230, 230, 250),
+    "SAND": _make_color(194, 178, 128),
+    "MINT": _make_color(152, 255, 152),
+    "DUSTY_ROSE": _make_color(220, 180, 180),
+    "NAVY": _make_color(0, 0, 128),
+    "FOREST": _make_color(34, 139, 34),
+}
+
+
+def _install_color_constants() -> None:
+    """
+    Attach every color in COLORS to Color as a class attribute.
+    """
+    for name, color in COLORS.items():
+        setattr(Color, name, color)
+
+
+_install_color_constants()
@@ -10,8 +10,10 @@ event processing, and coordinates the simulation loop between sensors and the gr
 from __future__ import annotations
 
 from collections.abc import Callable
+from copy import Error as CopyError
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass
+import pickle
 from typing import TypeVar, final
 
 import pygame
@@ -24,6 +26,66 @@ from src.engine.grid import PatchesGrid
 
 T = TypeVar("T")
 
+# High-frequency event types the engine never reacts to. Blocking them keeps
+# them out of the queue, so they neither wake the loop nor get converted.
+_BLOCKED_EVENT_TYPES = [pygame.MOUSEMOTION]
+
+
+def _snapshot(state: T) -> T:
+    """
+    Copy the global state so the next update cannot alias the previous one.
+
+    Pickling round-trips plain containers through C code and is several times
+    faster than deepcopy. States that cannot be pickled fall back to deepcopy.
+    Immutable states (None, numbers, strings and frozen dataclasses) cannot be
+    aliased harmfully and are returned as they are.
+
+    Args:
+        state (T): The state to copy
+
+    Returns:
+        T: An independent copy of the state
+
+    Raises:
+        TypeError: If the state can neither be pickled nor deep-copied
+    """
+    if _is_immutable(state):
+        return state
+
+    try:
+        return pickle.loads(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass
+
+    try:
+        return deepcopy(state)
+    except (CopyError, pickle.PicklingError, TypeError, AttributeError) as error:
+        raise TypeError(
+            f"The global state of type {type(state).__name__} cannot be copied between updates. Make it picklable, or set GeoNetConfig(immutable_state=True) if updates never mutate it."
+        ) from error
+
+
+def _is_immutable(state: object) -> bool:
+    """
+    Check whether a state can be shared between updates without copying.
+
+    Frozen dataclasses are trusted to hold immutable values as well; updates
+    are expected to return a new instance (e.g. via dataclasses.replace).
+
+    Args:
+        state (object): The state to check
+
+    Returns:
+        bool: True if the state is immutable
+    """
+    if state is None or isinstance(state, int | float | str | bytes):
+        return True
+    return (
+        is_dataclass(state)
+        and not isinstance(state, type)
+        and state.__dataclass_params__.frozen  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
 
 @dataclass(frozen=True)
 class GeoNetConfig:
@@ -39,8 +101,12 @@ class GeoNetConfig:
         window_title (str): Title displayed in the window title bar. Defaults to "GeoNet".
         grid_size (int): Number of cells in the grid (square grid). Defaults to 55.
         grid_margin (int): Margin around the grid in pixels. Defaults to 10.
-        fps (int): Target frames per second for the display. Defaults to 60.
+        fps (int): Formerly the frame rate of the idle loop. The engine now sleeps
+            until the next update or event, so it is unused. Defaults to 60.
         update_interval (int): Milliseconds between simulation updates. Defaults to 700.
+        immutable_state (bool): Set to True if the global state is never mutated in
+            place (e.g. tuples) to skip copying it every update. Frozen dataclass
+            states are detected and never copied. Defaults to False.
     """
 
     screen_width: int = 1000
@@ -53,6 +119,8 @@ class GeoNetConfig:
     fps: int = 60
     update_interval: int = 700
 
+    immutable_state: bool = False
+
 
 @final
 class GeoNetEngine:
@@ -63,15 +131,22 @@ class GeoNetEngine:
     and coordinates between the grid system and sensor manager. It provides the
     main simulation loop and user interaction handling.
 
+    The engine consumes the pygame event queue itself. It also blocks
+    MOUSEMOTION events for the whole process, so code that needs the mouse
+    position should call pygame.mouse.get_pos() instead of waiting for events.
+
     Attributes:
         _cfg (GeoNetConfig): Configuration settings for the engine
         _quit (bool): Flag indicating if the simulation should terminate
-        _clock (pygame.time.Clock): Pygame clock for controlling frame rate
         _screen (pygame.Surface): Main display surface
         _grid (PatchesGrid): The grid system for the simulation
         _sensor_manager (SensorManager): Manager for all sensors in the simulation
+        _margin_rects (list[pygame.Rect]): Screen areas around the grid that are
+            cleared every frame
         _tick_counter (int): Counter for simulation ticks
         _font (pygame.font.Font): Font for rendering text
+        _tick_prefix (pygame.Surface): Pre-rendered "Ticks: " label
+        _digit_glyphs (list[pygame.Surface]): Pre-rendered digits 0-9 for the counter
     """
 
     def __init__(self, config: GeoNetConfig | None = None) -> None:
@@ -81,18 +156,16 @@ class GeoNetEngine:
         Args:
             config (GeoNetConfig | None): Configuration object. If None, default config is used.
         """
-        if config is None:
-            cfg = GeoNetConfig()
-        else:
-            cfg = deepcopy(config)
-
-        self._cfg = cfg
+        self._cfg = config if config is not None else GeoNetConfig()
         self._quit = False
-        self._clock = pygame.time.Clock()
+        # main_loop ends with pygame.quit(), which also stops the timer that
+        # get_ticks reads; re-initialise so every engine in a process runs
+        _ = pygame.init()
         self._screen = pygame.display.set_mode(
             (self._cfg.screen_width, self._cfg.screen_height), pygame.DOUBLEBUF
         )
         pygame.display.set_caption(self._cfg.window_title)
+        pygame.event.set_blocked(_BLOCKED_EVENT_TYPES)
 
         self._grid = PatchesGrid(
             screen_width=self._cfg.screen_width,
@@ -101,39 +174,54 @@ class GeoNetEngine:
             grid_margin=self._cfg.grid_margin,
         )
         self._sensor_manager = SensorManager(self._grid)
+        self._margin_rects = self._build_margin_rects()
 
         self._tick_counter = 0
         pygame.font.init()
         self._font = pygame.font.Font(None, 24)
+        hud_color = Color.WHITE.to_pygame()
+        self._tick_prefix = self._font.render("Ticks: ", True, hud_color)
+        self._digit_glyphs = [
+            self._font.render(str(digit), True, hud_color) for digit in range(10)
+        ]
+
+    def _handle_events(self) -> None:
+        """
+        Process all queued pygame events.
+        """
+        for event in pygame.event.get():
+            self._handle_event(event)
 
-    def _handle_events[T](self) -> None:
+    def _handle_event[T](self, event: pygame.event.Event) -> None:
         """
-        Process pygame events including window close, keyboard input, and mouse clicks.
+        Process a pygame event including window close, keyboard input, and mouse clicks.
 
         Handles:
         - Window close button and ESC key for quitting
         - Mouse clicks for sensor inspection (prints sensor info to console)
+
+        Args:
+            event (pygame.event.Event): The event to process
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        if event.type == pygame.QUIT:
+            self._quit = True
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
                 self._quit = True
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self._quit = True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    is_valid, grid_pos = self._grid.pixel_to_grid(mouse_x, mouse_y)
-                    if is_valid:
-                        print("=" * 10)
-                        print(f"Clicked grid position: {grid_pos}")
-                        sensors: list[Sensor[T]] = self._sensor_manager.list_sensors()
-                        for sensor in sensors:
-                            if sensor.position == grid_pos:
-                                print(sensor)
-                                break
-                        print("=" * 10)
-                        print()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                mouse_x, mouse_y = pygame.mouse.get_pos()
+                is_valid, grid_pos = self._grid.pixel_to_grid(mouse_x, mouse_y)
+                if is_valid:
+                    print("=" * 10)
+                    print(f"Clicked grid position: {grid_pos}")
+                    sensors: list[Sensor[T]] = self._sensor_manager.list_sensors()
+                    for sensor in sensors:
+                        if sensor.position == grid_pos:
+                            print(sensor)
+                            break
+                    print("=" * 10)
+                    print()
 
     def _update(
         self,
@@ -155,25 +243,59 @@ class GeoNetEngine:
         def inner_update(global_state: T) -> T:
             return update_fn(self._sensor_manager, self._grid, global_state)
 
-        new_global_state = self._sensor_manager._update(inner_update, global_state)
+        clone_fn = None if self._cfg.immutable_state else _snapshot
+        new_global_state = self._sensor_manager._update(
+            inner_update, global_state, clone_fn=clone_fn
+        )
         return new_global_state
 
+    def _build_margin_rects(self) -> list[pygame.Rect]:
+        """
+        Split the screen area outside the grid into up to four bands.
+
+        Returns:
+            list[pygame.Rect]: The non-empty top, bottom, left and right bands
+        """
+        screen_width, screen_height = self._screen.get_size()
+        grid_rect = self._grid.pixel_rect().clip(self._screen.get_rect())
+        bands = [
+            pygame.Rect(0, 0, screen_width, grid_rect.top),
+            pygame.Rect(
+                0, grid_rect.bottom, screen_width, screen_height - grid_rect.bottom
+            ),
+            pygame.Rect(0, grid_rect.top, grid_rect.left, grid_rect.height),
+            pygame.Rect(
+                grid_rect.right,
+                grid_rect.top,
+                screen_width - grid_rect.right,
+                grid_rect.height,
+            ),
+        ]
+        return [band for band in bands if band.width > 0 and band.height > 0]
+
     def _draw(self) -> None:
         """
         Render the current simulation state to the screen.
 
         Draws the grid, sensors, connections, and displays the tick counter.
+        Only the margins are cleared, since the grid repaints its whole area.
         """
         self._tick_counter += 1
 
-        _ = self._screen.fill(Color.BLACK.to_tuple())
+        background = Color.BLACK.to_pygame()
+        for margin_rect in self._margin_rects:
+            _ = self._screen.fill(background, margin_rect)
 
-        tick_text = self._font.render(
-            f"Ticks: {self._tick_counter}", True, Color.WHITE.to_tuple()
-        )
+        # Compose the tick counter from pre-rendered glyphs
         tick_x = 10
         tick_y = 10
-        _ = self._screen.blit(tick_text, (tick_x, tick_y))
+        hud_blits = [(self._tick_prefix, (tick_x, tick_y))]
+        tick_x += self._tick_prefix.get_width()
+        for digit in str(self._tick_counter):
+            glyph = self._digit_glyphs[ord(digit) - ord("0")]
+            hud_blits.append((glyph, (tick_x, tick_y)))
+            tick_x += glyph.get_width()
+        _ = self._screen.blits(hud_blits, doreturn=False)
 
         self._grid._draw(self._screen)
         self._sensor_manager._draw(self._screen)
@@ -192,7 +314,8 @@ class GeoNetEngine:
 
         This method initializes the simulation with the setup function and then
         continuously runs the simulation loop, processing events, updating state,
-        and rendering the display at the configured intervals.
+        and rendering the display at the configured intervals. Between updates
+        the loop blocks until an event arrives or the next update is due.
 
         Args:
             setup_fn (Callable[[SensorManager, PatchesGrid], T]): Function called once at startup
@@ -201,22 +324,36 @@ class GeoNetEngine:
             update_fn (Callable[[SensorManager, PatchesGrid, T], T]): Function called every update
                 interval to update the simulation state. Receives sensor manager,
                 grid, and current global state. Defaults to a lambda that returns None.
+
+        The global state is copied after setup and after every update so that
+        update functions never alias an earlier state. It should be picklable;
+        other states fall back to the much slower deepcopy, and a TypeError is
+        raised if that fails too. Frozen dataclass states are shared instead of
+        copied, and GeoNetConfig.immutable_state skips the copies for any state.
         """
 
         global_state = setup_fn(self._sensor_manager, self._grid)
-        last_draw_time = pygame.time.get_ticks()
-        first_draw = True
+        if not self._cfg.immutable_state:
+            global_state = _snapshot(global_state)
+        update_interval = self._cfg.update_interval
+        next_update_time = pygame.time.get_ticks()
         while not self._quit:
-            self._handle_events()
-
             current_time = pygame.time.get_ticks()
-            if current_time - last_draw_time >= self._cfg.update_interval or first_draw:
-                new_global_state = self._update(update_fn, global_state)
+            if current_time >= next_update_time:
+                global_state = self._update(update_fn, global_state)
                 self._draw()
-                first_draw = False
-                global_state = deepcopy(new_global_state)
-                last_draw_time = pygame.time.get_ticks()
-
-            _ = self._clock.tick(self._cfg.fps)
+                # Keep a fixed cadence, but do not try to catch up on missed
+                # updates after a stall
+                next_update_time += update_interval
+                if next_update_time <= current_time:
+                    next_update_time = current_time + update_interval
+                # Updates can run back to back, so input is handled here too
+                self._handle_events()
+                continue
+
+            event = pygame.event.wait(next_update_time - current_time)
+            if event.type != pygame.NOEVENT:
+                self._handle_event(event)
+                self._handle_events()
 
         pygame.quit()
@@ -7,8 +7,12 @@ coordinate transformations, and visual rendering of the simulation space.
 
 from __future__ import annotations
 
-from typing import final
+from collections.abc import Callable, Sequence
+import pickle
+from typing import final, override
+import weakref
 
+import numpy as np
 import pygame
 
 from src.components.coords.coordinates import Coordinates
@@ -16,6 +20,35 @@ from src.components.coords.coordinates import Coordinates
 from .geo_color import Color
 
 
+# Beyond this many changed areas per frame, rebuilding the whole composite is
+# cheaper than patching it piece by piece
+_DIRTY_RECT_LIMIT = 40
+
+# Live grids by id(), so unpickling inside the process finds the shared instance
+_LIVE_GRIDS: weakref.WeakValueDictionary[int, PatchesGrid] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _shared_grid(grid_id: int) -> PatchesGrid:
+    """
+    Look up a live grid for unpickling.
+
+    Args:
+        grid_id (int): The id() of the pickled grid
+
+    Returns:
+        PatchesGrid: The grid itself
+
+    Raises:
+        pickle.UnpicklingError: If the grid no longer exists in this process
+    """
+    grid = _LIVE_GRIDS.get(grid_id)
+    if grid is None:
+        raise pickle.UnpicklingError("The pickled PatchesGrid no longer exists")
+    return grid
+
+
 @final
 class PatchesGrid:
     """
@@ -33,7 +66,35 @@ class PatchesGrid:
         _cell_size (float): Size of each cell in pixels
         _offset_x (int): Horizontal offset for centering the grid
         _offset_y (int): Vertical offset for centering the grid
-        _cell_colors (dict[Coordinates, Color]): Mapping of grid positions to colors
+        _cells (np.ndarray): Palette index of every cell as a (grid_size, grid_size)
+            uint32 array indexed by [x, y]
+        _palette (list[Color]): Colors referenced by the cell palette indices
+        _palette_ids (dict[Color, int]): Palette index of every color in _palette
+        _palette_limit (int): Palette size at which colors no cell uses anymore
+            are dropped
+        _grid_surface (pygame.Surface): The painted cells at their pixel size,
+            updated as soon as a color is set
+        _cell_edges (list[int]): Pixel offset of every cell border inside the grid
+        _cell_rects (list[pygame.Rect]): Pixel area of every cell inside the grid,
+            indexed by y * grid_size + x
+        _vline_endpoints (list[tuple[tuple[int, int], tuple[int, int]]]): Start and
+            end point of every vertical grid line, relative to the grid
+        _hline_endpoints (list[tuple[tuple[int, int], tuple[int, int]]]): Start and
+            end point of every horizontal grid line, relative to the grid
+        _grid_line_points (list[tuple[int, int]]): One polyline through all grid
+            lines, drawn with a single call
+        _grid_overlay (pygame.Surface): Transparent surface holding the grid lines
+            and border, drawn once
+        _composite_surface (pygame.Surface): Opaque copy of the painted cells with
+            the overlay on top, blitted to the screen every frame
+        _composite_dirty (bool): Whether the whole composite surface has to be
+            rebuilt on the next draw
+        _dirty_rects (list[pygame.Rect]): Areas inside the grid whose cells changed
+            since the last draw, patched into the composite surface one by one
+        _center_px_x (np.ndarray): Pixel x coordinate of each column's cell center
+        _center_px_y (np.ndarray): Pixel y coordinate of each row's cell center
+        _center_px_x_list (list[int]): _center_px_x as plain ints for scalar lookups
+        _center_px_y_list (list[int]): _center_px_y as plain ints for scalar lookups
     """
 
     # =======================
@@ -65,8 +126,86 @@ class PatchesGrid:
 
         self._offset_x: int = (screen_width - self._grid_width) // 2 + 80
         self._offset_y: int = (screen_height - self._grid_height) // 2
-        self._cell_colors: dict[Coordinates, Color] = {}
+
+        # Integer floor of (i + 0.5) * cell_size, free of float rounding
+        odd_halves = 2 * np.arange(grid_size, dtype=np.intp) + 1
+        cell_centers = odd_halves * self._grid_width // (2 * grid_size)
+        self._center_px_x: np.ndarray = self._offset_x + cell_centers
+        self._center_px_y: np.ndarray = self._offset_y + cell_centers
+        self._center_px_x_list: list[int] = self._center_px_x.tolist()
+        self._center_px_y_list: list[int] = self._center_px_y.tolist()
+
+        self._cells: np.ndarray = np.zeros((grid_size, grid_size), dtype=np.uint32)
+        self._palette: list[Color] = []
+        self._palette_ids: dict[Color, int] = {}
+        # Twice the cell count, so a compacted palette always has room to grow
+        self._palette_limit: int = max(256, 2 * grid_size * grid_size)
+        self._grid_surface = pygame.Surface((self._grid_width, self._grid_height))
+        self._cell_edges: list[int] = [
+            i * self._grid_width // grid_size for i in range(grid_size + 1)
+        ]
+        edges = self._cell_edges
+        self._cell_rects: list[pygame.Rect] = [
+            pygame.Rect(
+                edges[x], edges[y], edges[x + 1] - edges[x], edges[y + 1] - edges[y]
+            )
+            for y in range(grid_size)
+            for x in range(grid_size)
+        ]
+        self._vline_endpoints: list[tuple[tuple[int, int], tuple[int, int]]] = [
+            ((edge, 0), (edge, self._grid_height)) for edge in edges
+        ]
+        self._hline_endpoints: list[tuple[tuple[int, int], tuple[int, int]]] = [
+            ((0, edge), (self._grid_width, edge)) for edge in edges
+        ]
+        self._grid_line_points = self._build_grid_line_points()
+        self._grid_overlay = self._build_grid_overlay()
+        self._composite_surface = self._build_composite_surface()
+        self._composite_dirty = True
+        self._dirty_rects: list[pygame.Rect] = []
         self.fill_grid(Color.BLACK)
+        _LIVE_GRIDS[id(self)] = self
+
+    # =======================
+    # Copying
+    # =======================
+    def __copy__(self) -> PatchesGrid:
+        """
+        Return the grid itself.
+
+        The grid belongs to the engine and holds pygame surfaces, so states
+        that reference it share it instead of copying it.
+
+        Returns:
+            PatchesGrid: This grid
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> PatchesGrid:
+        """
+        Return the grid itself, like __copy__.
+
+        Args:
+            memo (dict[int, object]): The deepcopy memo
+
+        Returns:
+            PatchesGrid: This grid
+        """
+        return self
+
+    @override
+    def __reduce__(self) -> tuple[Callable[[int], PatchesGrid], tuple[int]]:
+        """
+        Pickle the grid as a reference to this live instance.
+
+        Unpickling in the same process returns this grid; pickles cannot be
+        loaded once it is gone or in another process.
+
+        Returns:
+            tuple[Callable[[int], PatchesGrid], tuple[int]]: The lookup function
+                and its arguments
+        """
+        return _shared_grid, (id(self),)
 
     # =======================
     # Cell information retrieval
@@ -84,8 +223,9 @@ class PatchesGrid:
         Raises:
             ValueError: If coordinates are invalid or out of bounds
         """
-        self._verify_cords(cord)
-        return self._cell_colors[cord]
+        if __debug__:
+            self._verify_cords(cord)
+        return self._palette[self._cells[int(cord.x), int(cord.y)]]
 
     # =======================
     # Cell modification and settings
@@ -101,8 +241,14 @@ class PatchesGrid:
         Raises:
             ValueError: If coordinates are invalid or out of bounds
         """
-        self._verify_cords(cords)
-        self._cell_colors[cords] = color
+        if __debug__:
+            self._verify_cords(cords)
+        grid_x = int(cords.x)
+        grid_y = int(cords.y)
+        self._cells[grid_x, grid_y] = self._palette_id(color)
+        cell_rect = self._cell_rects[grid_y * self._grid_size + grid_x]
+        _ = self._grid_surface.fill(color, cell_rect)
+        self._mark_dirty(cell_rect)
 
     def set_color_rect(
         self, starting_point: Coordinates, width: int, height: int, color: Color
@@ -119,14 +265,29 @@ class PatchesGrid:
         Raises:
             ValueError: If any coordinates in the rectangle are invalid or out of bounds
         """
-        for w in range(width):
-            for h in range(height):
-                current_cord = Coordinates(
-                    x=starting_point.x + w,
-                    y=starting_point.y + h,
-                )
-                self._verify_cords(current_cord)
-                self.set_color(current_cord, color)
+        if width <= 0 or height <= 0:
+            return
+
+        start_x = int(starting_point.x)
+        start_y = int(starting_point.y)
+        if __debug__:
+            self._verify_xy(start_x, start_y)
+            self._verify_xy(start_x + width - 1, start_y + height - 1)
+        self._cells[start_x : start_x + width, start_y : start_y + height] = (
+            self._palette_id(color)
+        )
+
+        edges = self._cell_edges
+        pixel_x = edges[start_x]
+        pixel_y = edges[start_y]
+        pixel_rect = pygame.Rect(
+            pixel_x,
+            pixel_y,
+            edges[start_x + width] - pixel_x,
+            edges[start_y + height] - pixel_y,
+        )
+        _ = self._grid_surface.fill(color, pixel_rect)
+        self._mark_dirty(pixel_rect)
 
     def fill_grid(self, color: Color) -> None:
         """
@@ -135,12 +296,13 @@ class PatchesGrid:
         Args:
             color (Color): The color to fill the entire grid with
         """
-        self.set_color_rect(
-            starting_point=Coordinates(0, 0),
-            width=self._grid_size,
-            height=self._grid_size,
-            color=color,
-        )
+        # The fill color becomes the only palette entry, index 0
+        self._palette = [color]
+        self._palette_ids = {color: 0}
+        self._cells.fill(0)
+        _ = self._grid_surface.fill(color)
+        self._composite_dirty = True
+        self._dirty_rects.clear()
 
     def clear_color(self) -> None:
         """
@@ -151,7 +313,7 @@ class PatchesGrid:
     # =======================
     # Coordinate conversion and positioning
     # =======================
-    def grid_to_pixel(self, grid_x: int, grid_y: int) -> tuple[float, float]:
+    def grid_to_pixel(self, grid_x: int, grid_y: int) -> tuple[int, int]:
         """
         Convert grid coordinates to pixel coordinates (center of cell).
 
@@ -160,15 +322,41 @@ class PatchesGrid:
             grid_y (int): Y coordinate in the grid
 
         Returns:
-            tuple[float, float]: Pixel coordinates (x, y) at the center of the cell
+            tuple[int, int]: Pixel coordinates (x, y) at the center of the cell
 
         Raises:
             ValueError: If grid coordinates are invalid or out of bounds
         """
-        self._verify_cords(Coordinates(grid_x, grid_y))
-        pixel_x = int(self._offset_x + (grid_x + 0.5) * self._cell_size)
-        pixel_y = int(self._offset_y + (grid_y + 0.5) * self._cell_size)
-        return pixel_x, pixel_y
+        if __debug__:
+            self._verify_xy(grid_x, grid_y)
+        return self._center_px_x_list[grid_x], self._center_px_y_list[grid_y]
+
+    def grid_to_pixel_array(
+        self, grid_xs: Sequence[float], grid_ys: Sequence[float]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convert many grid coordinates to pixel coordinates (center of cell) at once.
+
+        Coordinates are truncated to whole cells, matching ``int(x)`` on the
+        scalar path.
+
+        Args:
+            grid_xs (Sequence[float]): X coordinates in the grid
+            grid_ys (Sequence[float]): Y coordinates in the grid
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Pixel x and y coordinates at the center
+                of each cell
+
+        Raises:
+            ValueError: If any grid coordinate is out of bounds
+        """
+        xs = np.asarray(grid_xs, dtype=np.intp)
+        ys = np.asarray(grid_ys, dtype=np.intp)
+        if __debug__ and xs.size > 0:
+            self._verify_xy(int(xs.min()), int(ys.min()))
+            self._verify_xy(int(xs.max()), int(ys.max()))
+        return self._center_px_x[xs], self._center_px_y[ys]
 
     def pixel_to_grid(self, x: float, y: float) -> tuple[bool, Coordinates]:
         """
@@ -183,25 +371,91 @@ class PatchesGrid:
                 - bool: True if the pixel is within the grid bounds, False otherwise
                 - Coordinates: The corresponding grid coordinates (0,0 if out of bounds)
         """
-        if (
-            x < self._offset_x
-            or x >= self._offset_x + self._grid_width
-            or y < self._offset_y
-            or y >= self._offset_y + self._grid_height
-        ):
+        local_x = x - self._offset_x
+        local_y = y - self._offset_y
+        if not (0 <= local_x < self._grid_width and 0 <= local_y < self._grid_height):
             return False, Coordinates(0, 0)
-        grid_x = int((x - self._offset_x) / self._cell_size)
-        grid_y = int((y - self._offset_y) / self._cell_size)
 
-        try:
-            self._verify_cords(Coordinates(grid_x, grid_y))
+        # Integer floor division is exact for whole pixels, unlike dividing by
+        # the fractional cell size
+        grid_size = self._grid_size
+        grid_x = int(local_x * grid_size // self._grid_width)
+        grid_y = int(local_y * grid_size // self._grid_height)
+        if 0 <= grid_x < grid_size and 0 <= grid_y < grid_size:
             return True, Coordinates(grid_x, grid_y)
-        except ValueError:
-            return False, Coordinates(0, 0)
+        return False, Coordinates(0, 0)
+
+    def pixel_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered by the grid.
+
+        Returns:
+            pygame.Rect: The grid's position and size in pixels
+        """
+        return pygame.Rect(
+            self._offset_x, self._offset_y, self._grid_width, self._grid_height
+        )
 
     # =======================
     # Internal methods - DO NOT USE directly
     # =======================
+    def _palette_id(self, color: Color) -> int:
+        """
+        Get the palette index of a color, adding it to the palette if needed.
+
+        When the palette reaches _palette_limit, it is compacted to the colors
+        still present on the grid before the new color is added. The grid
+        shows at most one color per cell, so this never runs out of indices.
+
+        Args:
+            color (Color): The color to look up
+
+        Returns:
+            int: The palette index of the color
+        """
+        palette_id = self._palette_ids.get(color)
+        if palette_id is not None:
+            return palette_id
+
+        if len(self._palette) >= self._palette_limit:
+            self._compact_palette()
+
+        palette_id = len(self._palette)
+        self._palette.append(color)
+        self._palette_ids[color] = palette_id
+        return palette_id
+
+    def _compact_palette(self) -> None:
+        """
+        Drop palette colors that no cell uses anymore and renumber the rest.
+        """
+        used_ids = np.unique(self._cells)
+        remap = np.zeros(len(self._palette), dtype=np.uint32)
+        remap[used_ids] = np.arange(len(used_ids), dtype=np.uint32)
+        self._cells = remap[self._cells]
+        self._palette = [self._palette[palette_id] for palette_id in used_ids.tolist()]
+        self._palette_ids = {
+            color: palette_id for palette_id, color in enumerate(self._palette)
+        }
+
+    def _mark_dirty(self, rect: pygame.Rect) -> None:
+        """
+        Record an area of the grid surface that has to be copied into the composite.
+
+        Once more than _DIRTY_RECT_LIMIT areas are pending, the composite is
+        marked for a full rebuild instead.
+
+        Args:
+            rect (pygame.Rect): The changed area, relative to the grid
+        """
+        if self._composite_dirty:
+            return
+        if len(self._dirty_rects) >= _DIRTY_RECT_LIMIT:
+            self._composite_dirty = True
+            self._dirty_rects.clear()
+            return
+        self._dirty_rects.append(rect)
+
     def _verify_cords(self, cord: Coordinates) -> None:
         """
         Validate that coordinates are within the grid bounds.
@@ -213,67 +467,138 @@ class PatchesGrid:
             cord (Coordinates): The coordinates to validate
 
         Raises:
-            ValueError: If coordinates are not a Coordinates instance or are out of bounds
+            ValueError: If coordinates are out of bounds
         """
-        if self._grid_size <= cord.x or cord.x < 0:
-            raise ValueError(
-                f"Please stay inside the width confines of inclusive 0 to exclusive {self._grid_size} your value was {cord.x}"
-            )
-        if self._grid_size <= cord.y or cord.y < 0:
+        self._verify_xy(cord.x, cord.y)
+
+    def _verify_xy(self, x: float, y: float) -> None:
+        """
+        Validate that a grid position given as plain numbers is within the bounds.
+
+        The common in-bounds case is a single chained comparison; the error
+        messages are only built when the check fails. Callers skip the check
+        under ``python -O``, like the range checks of Color.
+
+        Args:
+            x (float): X coordinate in the grid
+            y (float): Y coordinate in the grid
+
+        Raises:
+            ValueError: If the position is out of bounds
+        """
+        grid_size = self._grid_size
+        if 0 <= x < grid_size and 0 <= y < grid_size:
+            return
+
+        if not 0 <= x < grid_size:
             raise ValueError(
-                f"Please stay inside the height confines of inclusive 0 to exclusive {self._grid_size} your value was {cord.y}"
+                f"Please stay inside the width confines of inclusive 0 to exclusive {grid_size} your value was {x}"
             )
+        raise ValueError(
+            f"Please stay inside the height confines of inclusive 0 to exclusive {grid_size} your value was {y}"
+        )
 
     def _draw(self, screen: pygame.Surface) -> None:
         """
         Draw the grid and all its colored cells to the screen.
 
         This internal method renders the entire grid including cell colors,
-        grid lines, and a border around the grid.
+        grid lines, and a border around the grid. The cells and the overlay
+        with the lines and border are combined into a cached surface. Only the
+        areas whose cells changed are copied into it again, so an unchanged
+        grid is drawn with one opaque blit.
 
         Args:
             screen (pygame.Surface): The pygame surface to draw on
         """
-        # Fill cells with their colors
-        for cords, color in self._cell_colors.items():
-            rect = pygame.Rect(
-                self._offset_x + cords.x * self._cell_size,
-                self._offset_y + cords.y * self._cell_size,
-                self._cell_size,
-                self._cell_size,
-            )
-            _ = pygame.draw.rect(screen, color.to_tuple(), rect)
-        # Draw vertical lines
-        for i in range(self._grid_size + 1):
-            x = self._offset_x + i * self._cell_size
-            _ = pygame.draw.line(
-                screen,
-                Color.LIGHT_GRAY.to_tuple(),
-                (x, self._offset_y),
-                (x, self._offset_y + self._grid_height),
-                1,
-            )
+        composite = self._composite_surface
+        offset = (self._offset_x, self._offset_y)
+        if self._composite_dirty:
+            # Fill cells with their colors, then draw grid lines and border
+            _ = composite.blit(self._grid_surface, (0, 0))
+            _ = composite.blit(self._grid_overlay, (0, 0))
+            self._composite_dirty = False
+        elif self._dirty_rects:
+            blit = composite.blit
+            grid_surface = self._grid_surface
+            grid_overlay = self._grid_overlay
+            for rect in self._dirty_rects:
+                _ = blit(grid_surface, rect, rect)
+                _ = blit(grid_overlay, rect, rect)
+            self._dirty_rects = []
+
+        _ = screen.blit(composite, offset)
+
+    def _build_grid_line_points(self) -> list[tuple[int, int]]:
+        """
+        Join all grid lines into one serpentine polyline.
 
-        # Draw horizontal lines
-        for i in range(self._grid_size + 1):
-            y = self._offset_y + i * self._cell_size
-            _ = pygame.draw.line(
-                screen,
-                Color.LIGHT_GRAY.to_tuple(),
-                (self._offset_x, y),
-                (self._offset_x + self._grid_width, y),
-                1,
-            )
+        Consecutive lines are walked in alternating directions, so every
+        connecting segment runs along the outermost grid lines and adds no
+        extra pixels.
+
+        Returns:
+            list[tuple[int, int]]: The points of the polyline
+        """
+        points: list[tuple[int, int]] = []
+        for i, (top, bottom) in enumerate(self._vline_endpoints):
+            points.extend((top, bottom) if i % 2 == 0 else (bottom, top))
+
+        # The vertical pass ends on the right edge, at the top or the bottom;
+        # the horizontal pass starts at that corner and walks back to the left
+        hlines = self._hline_endpoints
+        if points[-1][1] != 0:
+            hlines = hlines[::-1]
+        for i, (left, right) in enumerate(hlines):
+            points.extend((right, left) if i % 2 == 0 else (left, right))
+        return points
+
+    def _build_grid_overlay(self) -> pygame.Surface:
+        """
+        Render the grid lines and the border into a transparent surface.
+
+        The overlay covers the grid plus one pixel for the closing lines and is
+        blitted at the grid offset. The lines follow the precomputed polyline,
+        which sits on the same integer cell edges the cells are painted with.
+        When a display mode is set, the overlay is converted to its pixel format
+        so blending it into the composite needs no format conversion.
+
+        Returns:
+            pygame.Surface: The per-pixel alpha overlay
+        """
+        overlay = pygame.Surface(
+            (self._grid_width + 1, self._grid_height + 1), pygame.SRCALPHA
+        )
+        line_color = Color.LIGHT_GRAY.to_pygame()
+        border_color = Color.GRAY.to_pygame()
+
+        # Draw vertical and horizontal lines
+        _ = pygame.draw.lines(overlay, line_color, False, self._grid_line_points, 1)
 
         # Draw grid border
         _ = pygame.draw.rect(
-            screen,
-            Color.GRAY.to_tuple(),
-            (
-                self._offset_x,
-                self._offset_y,
-                self._grid_width,
-                self._grid_height,
-            ),
+            overlay,
+            border_color,
+            (0, 0, self._grid_width, self._grid_height),
             2,
         )
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        return overlay
+
+    def _build_composite_surface(self) -> pygame.Surface:
+        """
+        Create the opaque surface the cells and the overlay are combined into.
+
+        It has the overlay's size: the extra column and row only hold the
+        closing grid lines, which cover them completely. When a display mode
+        is set, the surface is converted to its pixel format so the per-frame
+        blit is a plain copy.
+
+        Returns:
+            pygame.Surface: The composite surface
+        """
+        composite = pygame.Surface((self._grid_width + 1, self._grid_height + 1))
+        if pygame.display.get_surface() is not None:
+            composite = composite.convert()
+        return composite